@@ -0,0 +1,46 @@
+"""JSON encode/decode helpers, using orjson when it is installed."""
+import hashlib
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def _stdlib_dumps(value) -> bytes:
+    return json.dumps(value).encode("utf-8")
+
+
+if orjson is not None:
+    # Hand datetimes and dataclasses to ``default`` (absent, so an error) instead of encoding them
+    _ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+
+    def dumps(value) -> bytes:
+        try:
+            data = orjson.dumps(value, option=_ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # Non-str keys, ints beyond 64 bits, passed-through types: stdlib json encodes or
+            # rejects them exactly as it would without orjson
+            return _stdlib_dumps(value)
+        if b"null" in data:
+            # orjson writes NaN/Infinity as null where stdlib json keeps them
+            return _stdlib_dumps(value)
+        return data
+
+    def loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Files written by stdlib json may contain NaN/Infinity, which orjson rejects
+            return json.loads(data)
+else:  # pragma: no cover - depends on environment
+    dumps = _stdlib_dumps
+    loads = json.loads
+
+
+def digest(data: bytes) -> bytes:
+    """Content fingerprint of serialized JSON, used to skip rewriting unchanged files."""
+    if isinstance(data, str):  # storages that ignore the binary open mode
+        data = data.encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
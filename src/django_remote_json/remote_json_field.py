@@ -1,18 +1,65 @@
-import json
+import functools
 import logging
 import re
+import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Any
 
 from django.conf import settings
 from django.core.files.base import ContentFile
 from django.core.files.storage import default_storage
-from django.db import models
-from django.db.models import CharField, ExpressionWrapper, F
+from django.db import connections, models, router, transaction
+from django.db.models import Value
+from django.db.models.query_utils import DeferredAttribute
 
+from ._json import digest, dumps
 from .remote_json_proxy import RemoteJSONProxy
 
+_FILE_PATH_RE = re.compile(
+    r"^(?:[\w\-./]+/)?\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?-[0-9a-fA-F-]+\.json$"
+)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_file_path_cached(value: str) -> bool:
+    name = value[value.rfind("/") + 1:]
+    if len(name) < 26 or name[4] != "-" or name[7] != "-" or name[10] != "T":
+        return False
+    return _FILE_PATH_RE.match(value) is not None
+
+
+@functools.lru_cache(maxsize=8192)
+def _uuid5(namespace: uuid.UUID, name: str) -> uuid.UUID:
+    return uuid.uuid5(namespace, name)
+
+
+class RemoteJSONDescriptor(DeferredAttribute):
+    """Field descriptor that remembers the file path of the last persisted proxy on the instance.
+
+    The path survives reassigning the field to a raw value, so pre_save can reuse the stored
+    file without querying the DB for it.
+    """
+
+    def __get__(self, instance, cls=None):
+        # Defining __set__ routes every read through here; keep the loaded case to one lookup
+        if instance is None:
+            return self
+        try:
+            return instance.__dict__[self.field.attname]
+        except KeyError:
+            return super().__get__(instance, cls)
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+        if isinstance(value, RemoteJSONProxy) and value._file_path:
+            instance.__dict__[self.field.db_path_attname] = value._file_path
+        elif value is None or isinstance(value, RemoteJSONProxy):
+            # What the DB assigns for a NULL or legacy column (e.g. refresh_from_db()): the
+            # recorded path may no longer be referenced, so let pre_save look it up
+            instance.__dict__.pop(self.field.db_path_attname, None)
+
 
 class RemoteJSONField(models.TextField):
     """
@@ -23,32 +70,123 @@ class RemoteJSONField(models.TextField):
       * On save: serialize JSON to storage, store path in DB column (TextField), keep a proxy on the instance.
       * Mutations through the proxy (item assignment, common list/dict mutators, in-place ops) mark it dirty; a subsequent save writes changes.
       * Assigning None deletes the remote file and stores NULL in the DB.
+      * With async_writes=True, uploads run on a shared thread pool and are awaited on transaction
+        commit, so saves inside one atomic block overlap their storage round-trips.
     """
 
     namespace = uuid.UUID("123e4567-e89b-12d3-a456-426614174000")
+    # Shared by every field using async_writes; created on first use
+    max_write_workers = 32
+    _executor = None
+    _executor_lock = threading.Lock()
+    # Latest queued async upload or delete per file path, so operations on one file run in order
+    _pending_writes = {}
+    _pending_lock = threading.Lock()
+    descriptor_class = RemoteJSONDescriptor
 
-    def __init__(self, *args, upload_to=None, **kwargs):
+    def __init__(self, *args, upload_to=None, async_writes=False, decoder=None, **kwargs):
         self.upload_to = upload_to or (lambda instance, filename: filename)
+        self.async_writes = async_writes
+        # Optional bytes -> value callable replacing the default parser on load
+        self.decoder = decoder
         super().__init__(*args, **kwargs)
 
+    @property
+    def db_path_attname(self):
+        return f"_{self.attname}_db_path"
+
     # ----------------- Helpers -----------------
     def raw_value(self, model_instance):
         if not model_instance.pk:
             return None
-        field_name = self.attname + "_raw"
-        annotation = {field_name: ExpressionWrapper(F(self.attname), output_field=CharField())}
-        return (
-            model_instance.__class__.objects.annotate(**annotation)
-            .filter(pk=model_instance.pk)
-            .values_list(field_name, flat=True)
-            .first()
-        )
+        # A single-column lookup by pk; plain SQL skips query compilation and from_db_value
+        meta = self.model._meta  # the table that holds this column, even under multi-table inheritance
+        connection = connections[router.db_for_read(self.model, instance=model_instance)]
+        quote = connection.ops.quote_name
+        sql = f"SELECT {quote(self.column)} FROM {quote(meta.db_table)} WHERE {quote(meta.pk.column)} = %s"
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [meta.pk.get_db_prep_value(model_instance.pk, connection)])
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def raw_values(self, model_instances):
+        """Stored column values for many saved instances, keyed by pk; one query per batch."""
+        pks = [obj.pk for obj in model_instances]
+        if not pks:
+            return {}
+        meta = self.model._meta
+        connection = connections[router.db_for_read(self.model, instance=model_instances[0])]
+        quote = connection.ops.quote_name
+        # Stay within the backend's parameter and IN-list limits, as Django's bulk helpers do
+        batch_size = max(connection.ops.bulk_batch_size([meta.pk], pks), 1)
+        max_in_list_size = connection.ops.max_in_list_size()
+        if max_in_list_size:
+            batch_size = min(batch_size, max_in_list_size)
+        params = [meta.pk.get_db_prep_value(pk, connection) for pk in pks]
+        rows = []
+        with connection.cursor() as cursor:
+            for start in range(0, len(params), batch_size):
+                batch = params[start:start + batch_size]
+                placeholders = ", ".join(["%s"] * len(batch))
+                cursor.execute(
+                    f"SELECT {quote(meta.pk.column)}, {quote(self.column)} FROM {quote(meta.db_table)} "
+                    f"WHERE {quote(meta.pk.column)} IN ({placeholders})",
+                    batch,
+                )
+                rows.extend(cursor.fetchall())
+        return {meta.pk.to_python(pk): value for pk, value in rows}
 
     def generate_file_path(self, model_instance):
         date = datetime.now().isoformat()
-        filename = f"{date}-{uuid.uuid5(self.namespace, str(model_instance.pk))}.json"
+        filename = f"{date}-{_uuid5(self.namespace, str(model_instance.pk))}.json"
         return self.upload_to(model_instance, filename)
 
+    @staticmethod
+    def _blocks_overwrite(file_path):
+        """True when the storage would pick another name instead of overwriting ``file_path``."""
+        # Django >= 5.1 FileSystemStorage / django-storages backends declare overwriting outright
+        for flag in ("allow_overwrite", "file_overwrite"):
+            if getattr(default_storage, flag, False):
+                return False
+        get_available_name = getattr(default_storage, "get_available_name", None)
+        if get_available_name is None:
+            return False
+        return get_available_name(file_path) != file_path
+
+    def _write(self, file_path, data: bytes):
+        content = ContentFile(data)
+        with content:
+            if self._blocks_overwrite(file_path):
+                default_storage.delete(file_path)
+            # Overwrite in place; most backends (e.g. S3) replace an existing object on save
+            saved_path = default_storage.save(file_path, content)
+            if saved_path != file_path:
+                # Backend refused to overwrite and picked another name; replace explicitly
+                default_storage.delete(saved_path)
+                default_storage.delete(file_path)
+                content.seek(0)
+                default_storage.save(file_path, content)
+
+    @classmethod
+    def _get_executor(cls):
+        if RemoteJSONField._executor is None:
+            with RemoteJSONField._executor_lock:
+                if RemoteJSONField._executor is None:
+                    RemoteJSONField._executor = ThreadPoolExecutor(
+                        max_workers=cls.max_write_workers, thread_name_prefix="remote-json"
+                    )
+        return RemoteJSONField._executor
+
+    def prefetch_queryset(self, objs, max_workers=32):
+        """Evaluate ``objs`` and load this field's JSON for every row concurrently.
+
+        Returns the objects as a list, e.g.
+        ``reports = Report._meta.get_field("payload").prefetch_queryset(Report.objects.all())``.
+        """
+        objs = list(objs)
+        RemoteJSONProxy.prefetch((getattr(obj, self.attname) for obj in objs), max_workers=max_workers)
+        return objs
+
     def is_file_path(self, value: str):
         """Heuristic to determine if a string is one of this field's stored file paths.
 
@@ -59,13 +197,23 @@ class RemoteJSONField(models.TextField):
           ISO-like timestamp (YYYY-MM-DDTHH:MM:SS[.microseconds])
           hyphen UUID-ish suffix (we don't strictly validate uuid5 here, just hex/dashes)
           .json extension
+
+        Cheap structural checks on the filename reject most non-path strings before
+        the regex engine is involved, and results for ``.json`` candidates are cached
+        since the same paths recur across joins and serializer loops.
         """
-        pattern = r"^(?:[\w\-./]+/)?\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}(?:\.\d+)?-[0-9a-fA-F-]+\.json$"
-        return bool(re.match(pattern, value))
+        if not value.endswith(".json"):
+            return False
+        return _is_file_path_cached(value)
 
     # ----------------- ORM integration -----------------
     def from_db_value(self, value, *args, **kwargs):  # type: ignore[override]
-        return self.to_python(value)
+        # The column only ever yields str or None, so skip to_python's type dispatch
+        if not value:
+            return None
+        if self.is_file_path(value):
+            return RemoteJSONProxy(file_path=value, decoder=self.decoder)
+        return RemoteJSONProxy(value)
 
     def to_python(self, value, model_instance=None):  # type: ignore[override]
         if not value:
@@ -78,57 +226,201 @@ class RemoteJSONField(models.TextField):
             return RemoteJSONProxy(value)
         if isinstance(value, str):
             if self.is_file_path(value):
-                return RemoteJSONProxy(file_path=value)
+                return RemoteJSONProxy(file_path=value, decoder=self.decoder)
             return RemoteJSONProxy(value)
         raise ValueError(
             f"RemoteJSONField could not convert value {value} - {type(value)} to python"
         )
 
     def get_prep_value(self, value) -> Any:  # type: ignore[override]
+        # Check for a proxy first: isinstance() against other types falls back to the
+        # proxy's __class__ property, which loads the remote file
+        if isinstance(value, RemoteJSONProxy):
+            # Ensure DB always stores the path (not actual JSON string)
+            return value._file_path
         if isinstance(value, str):
             return value
         if value is None:
             return None
-        if isinstance(value, RemoteJSONProxy):
-            # Ensure DB always stores the path (not actual JSON string)
-            return value._file_path
         raise TypeError(f"Unsupported raw type for RemoteJSONField: {value} - {type(value)}")
 
     def pre_save(self, model_instance, add):  # type: ignore[override]
-        raw_value = self.raw_value(model_instance)
+        file_path, json_data, content_hash = self._prepare_save(model_instance, add)
+        if json_data is None:
+            return file_path
+
+        if self.async_writes:
+            # Keep the value in memory: the file may not exist until the upload finishes
+            proxy = self._install_proxy(model_instance, file_path, keep_value=True)
+            future = self._submit_write(file_path, json_data, proxy, content_hash)
+            # on_commit re-raises any storage error to the committer
+            using = router.db_for_write(model_instance.__class__, instance=model_instance)
+            transaction.on_commit(future.result, using=using)
+        else:
+            self._write(file_path, json_data)
+            proxy = self._install_proxy(model_instance, file_path)
+            self._mark_written(proxy, proxy._revision, content_hash)
+        return file_path
+
+    def _prepare_save(self, model_instance, add):
+        """Resolve the stored path and serialise the value without uploading it.
+
+        Returns ``(file_path, json_data, content_hash)``; ``json_data`` is None when nothing
+        needs writing, in which case the instance attribute is already final.
+        """
+        value = getattr(model_instance, self.attname)
+
+        # A persisted proxy already knows its path, otherwise the descriptor may have recorded
+        # it; only ask the DB when neither does
+        raw_value = value._file_path if isinstance(value, RemoteJSONProxy) else None
+        if raw_value is None and not add:
+            raw_value = model_instance.__dict__.get(self.db_path_attname)
+            if raw_value is None:
+                raw_value = self.raw_value(model_instance)
         if raw_value:
             file_path = raw_value
         else:
             file_path = self.generate_file_path(model_instance)
 
-        value = getattr(model_instance, self.attname)
-
         if value is None:
             # Delete old file if present
             if raw_value:
-                default_storage.delete(file_path)
+                if self.async_writes:
+                    # Queue behind any pending upload, which would otherwise recreate the file
+                    future = self._submit(file_path, default_storage.delete, file_path)
+                    using = router.db_for_write(model_instance.__class__, instance=model_instance)
+                    transaction.on_commit(future.result, using=using)
+                else:
+                    default_storage.delete(file_path)
+            model_instance.__dict__.pop(self.db_path_attname, None)
             setattr(model_instance, self.attname, None)
-            return None
+            return None, None, None
 
         if isinstance(value, RemoteJSONProxy):
             if not value._file_path:
                 value._file_path = file_path
             if not value.needs_save:
                 setattr(model_instance, self.attname, value)
-                return value._file_path
-            json_data = json.dumps(value.get())
-            value.mark_saved()
+                return value._file_path, None, None
+            value._lazy_load()
+            json_data = dumps(value._value)
+            content_hash = digest(json_data)
+            if raw_value and content_hash == value._hash and not self._write_pending(file_path):
+                # Mutations left the content identical to the stored file; while an upload
+                # is queued the file is about to change, so _hash no longer describes it
+                value.mark_saved()
+                setattr(model_instance, self.attname, value)
+                return value._file_path, None, None
         else:
-            json_data = json.dumps(value)
-
-        # Replace existing file to avoid orphaning
-        if raw_value:
-            default_storage.delete(file_path)
-        default_storage.save(file_path, ContentFile(json_data.encode("utf-8")))
+            json_data = dumps(value)
+            content_hash = digest(json_data)
+        return file_path, json_data, content_hash
 
-        proxy = value if isinstance(value, RemoteJSONProxy) else RemoteJSONProxy(file_path=file_path)
+    def _install_proxy(self, model_instance, file_path, keep_value=False):
+        """Put a proxy for ``file_path`` on the instance; it stays dirty until _mark_written."""
+        value = getattr(model_instance, self.attname)
+        if isinstance(value, RemoteJSONProxy):
+            proxy = value
+        elif keep_value:
+            proxy = RemoteJSONProxy(value, file_path=file_path, decoder=self.decoder)
+            proxy._dirty = True
+        else:
+            # Written synchronously already, so the file can be loaded lazily
+            proxy = RemoteJSONProxy(file_path=file_path, decoder=self.decoder)
         setattr(model_instance, self.attname, proxy)
-        return file_path
+        return proxy
+
+    @staticmethod
+    def _mark_written(proxy, revision, content_hash):
+        proxy.mark_saved(revision)
+        proxy._hash = content_hash
+
+    def _submit_write(self, file_path, data, proxy, content_hash):
+        return self._submit(
+            file_path, self._write_and_mark, file_path, data, proxy, proxy._revision, content_hash
+        )
+
+    def _write_and_mark(self, file_path, data, proxy, revision, content_hash):
+        self._write(file_path, data)
+        self._mark_written(proxy, revision, content_hash)
+
+    def _submit(self, file_path, fn, *args):
+        """Run ``fn(*args)`` on the executor after every storage operation queued for ``file_path``."""
+        with RemoteJSONField._pending_lock:
+            previous = RemoteJSONField._pending_writes.get(file_path)
+            future = self._get_executor().submit(self._run_after, previous, fn, *args)
+            RemoteJSONField._pending_writes[file_path] = future
+        future.add_done_callback(lambda done: self._forget_write(file_path, done))
+        return future
+
+    @staticmethod
+    def _run_after(previous, fn, *args):
+        # The pool is FIFO, so an earlier operation on the same path is already running or done
+        if previous is not None:
+            wait([previous])
+        fn(*args)
+
+    @staticmethod
+    def _write_pending(file_path):
+        with RemoteJSONField._pending_lock:
+            return file_path in RemoteJSONField._pending_writes
+
+    @staticmethod
+    def _forget_write(file_path, future):
+        with RemoteJSONField._pending_lock:
+            if RemoteJSONField._pending_writes.get(file_path) is future:
+                del RemoteJSONField._pending_writes[file_path]
+
+    @classmethod
+    def bulk_save_remote(cls, objs, field_name, max_workers=64):
+        """Write a RemoteJSONField for many existing rows with concurrent uploads.
+
+        Every object's value is serialised first, all uploads then run on a thread pool, and
+        the resulting paths are stored with a single ``bulk_update``. Returns the objects.
+        """
+        objs = list(objs)
+        if not objs:
+            return objs
+        if any(obj.pk is None for obj in objs):
+            raise ValueError("bulk_save_remote() objects must already be saved (have a primary key).")
+        model = objs[0].__class__
+        field = model._meta.get_field(field_name)
+        if not isinstance(field, cls):
+            raise ValueError(f"{model.__name__}.{field_name} is not a {cls.__name__}.")
+
+        # Look up the stored paths nothing recorded in one query rather than one per object
+        unknown = [
+            obj for obj in objs
+            if field.db_path_attname not in obj.__dict__
+            and getattr(obj.__dict__.get(field.attname), "_file_path", None) is None
+        ]
+        stored = field.raw_values(unknown)
+        for obj in unknown:
+            obj.__dict__[field.db_path_attname] = stored.get(obj.pk) or ""
+
+        pending = []
+        for obj in objs:
+            file_path, json_data, content_hash = field._prepare_save(obj, add=False)
+            if json_data is not None:
+                pending.append((obj, file_path, json_data, content_hash))
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+                list(executor.map(lambda write: field._write(write[1], write[2]), pending))
+            for obj, file_path, _, content_hash in pending:
+                proxy = field._install_proxy(obj, file_path)
+                field._mark_written(proxy, proxy._revision, content_hash)
+
+        # Hand bulk_update the stored paths as expressions: it probes plain values for
+        # resolve_expression, which on a proxy would load the remote file
+        values = [getattr(obj, field.attname) for obj in objs]
+        for obj, value in zip(objs, values):
+            obj.__dict__[field.attname] = Value(field.get_prep_value(value), output_field=field)
+        try:
+            model._base_manager.bulk_update(objs, [field.name])
+        finally:
+            for obj, value in zip(objs, values):
+                obj.__dict__[field.attname] = value
+        return objs
 
     # ----------------- Debug logging (optional) -----------------
     @staticmethod
@@ -1,7 +1,15 @@
-import json
+from concurrent.futures import ThreadPoolExecutor
 
 from django.core.files.storage import default_storage
 
+from ._json import digest, loads
+
+# Methods of the wrapped value that mutate it in place and so mark the proxy dirty
+_MUTATING = frozenset({
+    'append', 'extend', 'insert', 'pop', 'popitem', 'remove', 'clear', 'update',
+    'setdefault', 'reverse', 'sort', 'discard', 'add'
+})
+
 
 class RemoteJSONProxy:
     """Proxy around a JSON-serialisable value persisted remotely.
@@ -10,14 +18,26 @@ class RemoteJSONProxy:
       - RemoteJSONProxy(value=<obj>)  -> new unsaved value (marked dirty, needs save)
       - RemoteJSONProxy(file_path=<path>) -> reference to existing stored file (lazy load)
       - RemoteJSONProxy(value=<obj>, file_path=<path>) -> existing value already persisted
+
+    ``decoder`` optionally replaces the default JSON parser when loading the file; it is
+    called with the raw bytes, e.g. ``msgspec.json.Decoder(MySchema).decode``.
     """
 
-    def __init__(self, value=None, file_path=None):
+    __slots__ = (
+        '_file_path', '_loaded', '_value', '_revision', '_saved_revision', '_mutator_cache', '_hash',
+        '_decoder', '__weakref__',
+    )
+
+    def __init__(self, value=None, file_path=None, decoder=None):
         self._file_path = file_path
         self._loaded = value is not None  # value provided implies already loaded
         self._value = value
+        self._revision = 0  # bumped by every mutation
+        self._saved_revision = 0  # revision of the content last written to storage
         self._dirty = value is not None and file_path is None
-        self._mutator_cache = {}
+        self._mutator_cache = None  # created on first mutator access; most proxies never need it
+        self._hash = None  # digest of the stored file's bytes, when known
+        self._decoder = decoder
 
     def _file_url(self):
         if self._file_path:
@@ -29,12 +49,35 @@ class RemoteJSONProxy:
             return
         
         if self._file_path:
-            with default_storage.open(self._file_path) as fh:
-                self._value = json.load(fh)
+            data = self._read()
+            self._value = self._decode(data)
+            self._hash = digest(data)
         else:
             self._value = None
         self._loaded = True
-        
+
+    def _decode(self, data):
+        return loads(data) if self._decoder is None else self._decoder(data)
+
+    def _read(self):
+        with default_storage.open(self._file_path, "rb") as fh:
+            return fh.read()
+
+    @classmethod
+    def prefetch(cls, proxies, max_workers=32):
+        """Load many lazy proxies with concurrent storage reads.
+
+        Proxies that are None, already loaded or have no file path are skipped.
+        """
+        pending = [p for p in proxies if p is not None and not p._loaded and p._file_path]
+        if not pending:
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            for proxy, data in zip(pending, executor.map(cls._read, pending)):
+                proxy._value = proxy._decode(data)
+                proxy._hash = digest(data)
+                proxy._loaded = True
+
     def get(self):
         self._lazy_load()
         return self._value
@@ -44,6 +87,7 @@ class RemoteJSONProxy:
         return self._value.get(*args, **kwargs)
 
     def set(self, value):
+        """Replace the whole value; an unloaded file is never downloaded just to be overwritten."""
         self._value = value
         self._loaded = True
         self._dirty = True
@@ -99,21 +143,20 @@ class RemoteJSONProxy:
 
     # ----- Attribute / mutator delegation -----
     def __getattr__(self, item):
+        cache = self._mutator_cache
+        if cache is not None and item in cache:
+            return cache[item]
         self._lazy_load()
         attr = getattr(self._value, item)
-        MUTATING = {
-            'append', 'extend', 'insert', 'pop', 'popitem', 'remove', 'clear', 'update',
-            'setdefault', 'reverse', 'sort', 'discard', 'add'
-        }
-        if callable(attr) and item in MUTATING:
-            if item in self._mutator_cache:
-                return self._mutator_cache[item]
-
+        if callable(attr) and item in _MUTATING:
+            # Resolve the method per call so the wrapper stays valid if _value is replaced
             def wrapper(*args, **kwargs):
-                result = attr(*args, **kwargs)
+                result = getattr(self._value, item)(*args, **kwargs)
                 self._dirty = True
                 return result
-            self._mutator_cache[item] = wrapper
+            if cache is None:
+                cache = self._mutator_cache = {}
+            cache[item] = wrapper
             return wrapper
         return attr
 
@@ -141,9 +184,25 @@ class RemoteJSONProxy:
     def __contains__(self, item): self._lazy_load(); return item in self._value  # type: ignore[operator]
 
     # ----- Dirty tracking -----
+    @property
+    def _dirty(self): return self._revision != self._saved_revision
+
+    @_dirty.setter
+    def _dirty(self, dirty):
+        if dirty:
+            self._revision += 1
+        else:
+            self._saved_revision = self._revision
+
     @property
     def needs_save(self): return self._dirty
-    def mark_saved(self): self._dirty = False
+
+    def mark_saved(self, revision=None):
+        """Mark the content as stored; pass the ``_revision`` that was serialised so mutations
+        made while the write was in flight keep the proxy dirty."""
+        if revision is None:
+            revision = self._revision
+        self._saved_revision = max(self._saved_revision, revision)
 
     # ----- Pickle / Copy support -----
     def __getstate__(self):
@@ -153,6 +212,8 @@ class RemoteJSONProxy:
             '_loaded': self._loaded,
             '_value': self._value,
             '_dirty': self._dirty,
+            '_hash': self._hash,
+            '_decoder': self._decoder,
         }
 
     def __setstate__(self, state):
@@ -160,8 +221,11 @@ class RemoteJSONProxy:
         self._file_path = state['_file_path']
         self._loaded = state['_loaded']
         self._value = state['_value']
+        self._revision = self._saved_revision = 0
         self._dirty = state['_dirty']
-        self._mutator_cache = {}
+        self._mutator_cache = None
+        self._hash = state.get('_hash')
+        self._decoder = state.get('_decoder')
 
     def __deepcopy__(self, memo):
         """Explicit deepcopy support to avoid issues with __getattr__."""
@@ -169,6 +233,7 @@ class RemoteJSONProxy:
         return RemoteJSONProxy(
             value=deepcopy(self._value, memo) if self._loaded else None,
             file_path=self._file_path,  # file paths are strings, no need to deepcopy
+            decoder=self._decoder,
         )
 
     # Generic operator helpers for extended ops
@@ -210,12 +275,20 @@ _BINARY_OPS = [
     'add', 'sub', 'mul', 'matmul', 'truediv', 'floordiv', 'mod', 'pow',
     'lshift', 'rshift', 'and', 'xor', 'or'
 ]
+
+# Operators are looked up on the type's slots, never through __getattr__ (on the
+# instance or a metaclass), so these must exist on the class up front.
+def _install_op(method_name, helper, op_name):
+    def op(self, other):
+        return helper(self, other, op_name)
+    op.__name__ = method_name
+    op.__qualname__ = f'RemoteJSONProxy.{method_name}'
+    setattr(RemoteJSONProxy, method_name, op)
+
+
 for _name in _BINARY_OPS:
-    def _make_bin(n): return lambda self, other, _n=n: RemoteJSONProxy._binary_op(self, other, _n)
-    def _make_ref(n): return lambda self, other, _n=n: RemoteJSONProxy._reflected_op(self, other, _n)
-    def _make_in(n): return lambda self, other, _n=n: RemoteJSONProxy._inplace_op(self, other, _n)
-    setattr(RemoteJSONProxy, f'__{_name}__', _make_bin(_name))
-    setattr(RemoteJSONProxy, f'__r{_name}__', _make_ref(_name))
-    setattr(RemoteJSONProxy, f'__i{_name}__', _make_in(_name))
-
-del _name, _make_bin, _make_ref, _make_in, _BINARY_OPS
+    _install_op(f'__{_name}__', RemoteJSONProxy._binary_op, _name)
+    _install_op(f'__r{_name}__', RemoteJSONProxy._reflected_op, _name)
+    _install_op(f'__i{_name}__', RemoteJSONProxy._inplace_op, _name)
+
+del _name, _install_op, _BINARY_OPS
@@ -4,3 +4,7 @@ from django_remote_json import RemoteJSONField
 
 class SampleModel(models.Model):
     remote_data = RemoteJSONField(null=True)
+
+
+class AsyncSampleModel(models.Model):
+    remote_data = RemoteJSONField(null=True, async_writes=True)
@@ -8,8 +8,10 @@ import pytest
 
 pytestmark = pytest.mark.django_db
 
+from django.test.utils import CaptureQueriesContext
+
 from django_remote_json import RemoteJSONField, RemoteJSONProxy
-from .models import SampleModel
+from .models import AsyncSampleModel, SampleModel
 
 class MemoryStorage:
     def __init__(self):
@@ -419,3 +421,430 @@ def test_proxy_ne_and_repr_str():
 def test_is_file_path_bare_filename():
     field = RemoteJSONField()
     assert field.is_file_path('2025-09-05T12:34:56-deadbeef.json')
+
+
+def test_pre_save_skips_raw_value_query_for_loaded_proxy(storage_patched, django_assert_num_queries):
+    obj = create(); obj.remote_data = {"a": 1}; obj.save(); obj.refresh_from_db()
+    with django_assert_num_queries(1):  # UPDATE only, no SELECT for the stored path
+        obj.save()
+
+
+def test_rewrite_overwrites_without_delete(storage_patched):
+    storage = storage_patched
+    obj = create()
+    for _ in range(3):
+        obj.remote_data = {"foo": "bar"}
+        obj.save()
+    assert storage.delete_count == 0
+    assert len(storage.files) == 1
+
+
+def test_rewrite_on_non_overwriting_storage_keeps_path(storage_patched):
+    storage = storage_patched
+    original_save = MemoryStorage.save
+
+    def save_no_overwrite(path, content_file):
+        if path in storage.files:
+            path = path.replace(".json", "_alt.json")
+        return original_save(storage, path, content_file)
+
+    storage.save = save_no_overwrite
+    obj = create(); obj.remote_data = {"v": 1}; obj.save()
+    path = obj.remote_data._file_path
+    obj.remote_data = {"v": 2}; obj.save()
+    assert obj.remote_data._file_path == path
+    assert list(storage.files) == [path]
+    assert json.loads(storage.files[path]) == {"v": 2}
+
+
+def test_async_writes_upload_on_commit(storage_patched, django_capture_on_commit_callbacks):
+    storage = storage_patched
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        objs = []
+        for i in range(5):
+            obj = AsyncSampleModel.objects.create()
+            obj.remote_data = {"i": i}
+            obj.save()
+            objs.append(obj)
+    assert len(callbacks) == 5
+    assert storage.save_count == 5
+    for i, obj in enumerate(objs):
+        assert not obj.remote_data.needs_save
+        assert json.loads(storage.files[obj.remote_data._file_path]) == {"i": i}
+
+
+def test_async_writes_error_raised_on_commit(storage_patched, django_capture_on_commit_callbacks):
+    storage = storage_patched
+
+    def failing_save(path, content_file):
+        raise OSError("storage down")
+
+    storage.save = failing_save
+    with pytest.raises(OSError):
+        with django_capture_on_commit_callbacks(execute=True):
+            obj = AsyncSampleModel.objects.create()
+            obj.remote_data = {"a": 1}
+            obj.save()
+
+
+def test_prefetch_loads_proxies_concurrently(storage_patched):
+    storage = storage_patched
+    paths = [f'2025-01-04T00:00:0{i}-deadbeef-dead-beef-dead-beefdeadbeef.json' for i in range(4)]
+    for i, path in enumerate(paths):
+        storage.files[path] = json.dumps({'i': i})
+    proxies = [RemoteJSONProxy(file_path=path) for path in paths] + [None, RemoteJSONProxy([1])]
+    RemoteJSONProxy.prefetch(proxies, max_workers=2)
+    for i, proxy in enumerate(proxies[:4]):
+        assert proxy._loaded is True
+        assert proxy._value == {'i': i}
+    assert proxies[5]._value == [1]
+
+
+def test_field_prefetch_queryset(storage_patched):
+    for i in range(3):
+        obj = create(); obj.remote_data = [i]; obj.save()
+    field: RemoteJSONField = SampleModel._meta.get_field('remote_data')  # type: ignore[assignment]
+    objs = field.prefetch_queryset(SampleModel.objects.order_by('pk'))
+    assert [obj.remote_data._value for obj in objs] == [[0], [1], [2]]
+    assert all(obj.remote_data._loaded for obj in objs)
+
+
+def test_cached_mutator_follows_replaced_value():
+    p = RemoteJSONProxy([1])
+    p.append(2)
+    p.set([10])
+    p.mark_saved()
+    p.append(11)
+    assert p._value == [10, 11]
+    assert p.needs_save
+
+
+def test_proxy_slots_and_state_roundtrip():
+    from copy import deepcopy
+    p = RemoteJSONProxy({"a": 1})
+    with pytest.raises(AttributeError):
+        object.__getattribute__(p, '__dict__')
+    import weakref
+    assert weakref.ref(p)() is p
+    clone = object.__new__(RemoteJSONProxy)
+    clone.__setstate__(p.__getstate__())
+    assert clone == {"a": 1}
+    assert clone.needs_save
+    clone.update({"b": 2})
+    assert clone._value == {"a": 1, "b": 2}
+    copied = deepcopy(clone)
+    assert copied._value == {"a": 1, "b": 2}
+    assert copied._value is not clone._value
+
+
+def test_generated_operators_dispatch():
+    p = RemoteJSONProxy(12)
+    assert p - 2 == 10
+    assert 20 - p == 8
+    assert p // 5 == 2
+    assert p % 5 == 2
+    assert p | 1 == 13
+    assert 2 ** RemoteJSONProxy(3) == 8
+    assert RemoteJSONProxy.__sub__.__name__ == '__sub__'
+    p -= 2  # type: ignore[operator]
+    assert p._value == 10
+
+
+def test_unchanged_content_after_mutation_skips_upload(storage_patched):
+    storage = storage_patched
+    obj = create(); obj.remote_data = {"a": 1}; obj.save(); obj.refresh_from_db()
+    initial = storage.save_count
+    proxy = obj.remote_data
+    proxy["a"] = 2; proxy["a"] = 1
+    assert proxy.needs_save
+    obj.save()
+    assert storage.save_count == initial
+    assert not proxy.needs_save
+    proxy["a"] = 3
+    obj.save()
+    assert storage.save_count == initial + 1
+    # Hash follows the written content, so reverting to it is a no-op again
+    proxy["a"] = 3
+    obj.save()
+    assert storage.save_count == initial + 1
+
+
+def test_custom_decoder_used_on_load(storage_patched):
+    storage = storage_patched
+    path = '2025-01-05T00:00:00-deadbeef-dead-beef-dead-beefdeadbeef.json'
+    storage.files[path] = json.dumps({'n': 1})
+    calls = []
+
+    def decoder(data):
+        calls.append(data)
+        return {'decoded': json.loads(data)}
+
+    field = RemoteJSONField(decoder=decoder)
+    proxy = field.to_python(path)
+    assert proxy['decoded'] == {'n': 1}
+    other = field.to_python(path)
+    RemoteJSONProxy.prefetch([other])
+    assert other._value == {'decoded': {'n': 1}}
+    assert len(calls) == 2
+
+
+def test_reassign_after_load_reuses_recorded_path(storage_patched, django_assert_num_queries):
+    storage = storage_patched
+    obj = create(); obj.remote_data = {"a": 1}; obj.save()
+    obj = SampleModel.objects.get(pk=obj.pk)
+    path = obj.remote_data._file_path
+    obj.remote_data = {"a": 2}
+    with django_assert_num_queries(1):  # UPDATE only
+        obj.save()
+    assert obj.remote_data._file_path == path
+    assert json.loads(storage.files[path]) == {"a": 2}
+    obj.remote_data = None
+    with django_assert_num_queries(2):  # None may come from the DB, so the path is looked up
+        obj.save()
+    assert path not in storage.files
+    assert '_remote_data_db_path' not in obj.__dict__
+
+
+def test_refresh_to_null_forgets_recorded_path(storage_patched):
+    storage = storage_patched
+    obj = create(); obj.remote_data = {"a": 1}; obj.save()
+    old_path = obj.remote_data._file_path
+    SampleModel.objects.filter(pk=obj.pk).update(remote_data=None)
+    obj.refresh_from_db()
+    assert obj.remote_data is None
+    assert '_remote_data_db_path' not in obj.__dict__
+    obj.remote_data = {"a": 2}
+    obj.save()
+    assert obj.remote_data._file_path != old_path
+
+
+def test_bulk_save_remote(storage_patched):
+    storage = storage_patched
+    objs = [create() for _ in range(4)]
+    for i, obj in enumerate(objs):
+        obj.remote_data = {"i": i}
+    objs[3].remote_data = None
+    with mock.patch.object(storage, 'open', side_effect=AssertionError("unexpected load")):
+        RemoteJSONField.bulk_save_remote(objs, 'remote_data', max_workers=2)
+    assert storage.save_count == 3
+    for i, obj in enumerate(objs[:3]):
+        obj.refresh_from_db()
+        assert json.loads(storage.files[obj.remote_data._file_path]) == {"i": i}
+    objs[3].refresh_from_db()
+    assert objs[3].remote_data is None
+    with pytest.raises(ValueError):
+        RemoteJSONField.bulk_save_remote([SampleModel(remote_data={})], 'remote_data')
+
+
+def test_bulk_save_remote_resolves_paths_in_one_query(storage_patched, django_assert_num_queries):
+    storage = storage_patched
+    for i in range(3):
+        obj = create(); obj.remote_data = {"old": i}; obj.save()
+    paths = dict(SampleModel.objects.values_list('pk', 'remote_data'))
+    objs = list(SampleModel.objects.defer('remote_data'))
+    for obj in objs:
+        obj.remote_data = {"new": obj.pk}
+    with django_assert_num_queries(2):  # one path lookup, one bulk UPDATE
+        RemoteJSONField.bulk_save_remote(objs, 'remote_data')
+    for obj in objs:
+        path = paths[obj.pk]._file_path
+        assert obj.remote_data._file_path == path
+        assert json.loads(storage.files[path]) == {"new": obj.pk}
+
+
+def test_raw_values_batches_by_backend_limits():
+    objs = [create() for _ in range(5)]
+    field = SampleModel._meta.get_field('remote_data')
+    from django.db import connection
+    with mock.patch.object(connection.ops, 'max_in_list_size', return_value=2):
+        with CaptureQueriesContext(connection) as ctx:
+            assert field.raw_values(objs) == {obj.pk: None for obj in objs}
+    assert len(ctx.captured_queries) == 3
+    with pytest.raises(ValueError):
+        RemoteJSONField.bulk_save_remote(objs, 'id')
+
+
+def test_bulk_save_remote_upload_failure_keeps_proxies_dirty(storage_patched):
+    storage = storage_patched
+    obj = create(); obj.remote_data = {"a": 1}; obj.save(); obj.refresh_from_db()
+    obj.remote_data["a"] = 2
+    with mock.patch.object(storage, 'save', side_effect=OSError("upload failed")):
+        with pytest.raises(OSError):
+            RemoteJSONField.bulk_save_remote([obj], 'remote_data')
+    assert obj.remote_data._dirty
+
+
+def test_set_overwrites_without_loading(storage_patched):
+    storage = storage_patched
+    obj = create(); obj.remote_data = {"old": True}; obj.save(); obj.refresh_from_db()
+    with mock.patch.object(storage, 'open', side_effect=AssertionError("unexpected load")):
+        obj.remote_data.set({"new": True})
+        obj.save()
+    assert json.loads(storage.files[obj.remote_data._file_path]) == {"new": True}
+
+
+def test_from_db_value_variants():
+    field = RemoteJSONField()
+    assert field.from_db_value(None, None, None) is None
+    assert field.from_db_value('', None, None) is None
+    path = '2025-01-07T00:00:00-deadbeef-dead-beef-dead-beefdeadbeef.json'
+    proxy = field.from_db_value(path, None, None)
+    assert proxy._file_path == path and proxy._loaded is False
+    raw = field.from_db_value('plain text', None, None)
+    assert raw._file_path is None and raw._value == 'plain text'
+
+
+def test_json_helpers_stdlib_compatibility():
+    from django_remote_json import _json
+    assert _json.loads(b'{"a": NaN}')['a'] != _json.loads(b'{"a": NaN}')['a']  # NaN still readable
+    big = 2 ** 70
+    assert _json.loads(_json.dumps({"n": big})) == {"n": big}
+    with pytest.raises(TypeError):
+        _json.dumps({1, 2})
+    import dataclasses
+    import datetime
+    import math
+    with pytest.raises(TypeError):
+        _json.dumps({"when": datetime.datetime(2025, 1, 1)})
+    with pytest.raises(TypeError):
+        _json.dumps([dataclasses.make_dataclass("Point", ["x"])(1)])
+    assert math.isnan(_json.loads(_json.dumps({"x": float("nan")}))["x"])
+    assert _json.loads(_json.dumps({"x": float("inf"), "y": None})) == {"x": float("inf"), "y": None}
+    assert _json.loads(_json.dumps({1: "a"})) == {"1": "a"}
+
+
+def test_rewrite_on_storage_reporting_no_overwrite_deletes_first(storage_patched):
+    storage = storage_patched
+    storage.get_available_name = lambda name: name.replace(".json", "_alt.json") if name in storage.files else name
+    obj = create(); obj.remote_data = {"v": 1}; obj.save()
+    path = obj.remote_data._file_path
+    obj.remote_data = {"v": 2}; obj.save()
+    assert (storage.save_count, storage.delete_count) == (2, 1)
+    assert list(storage.files) == [path]
+    assert json.loads(storage.files[path]) == {"v": 2}
+
+
+def test_rewrite_on_filesystem_storage(tmp_path, monkeypatch):
+    from django.core.files.storage import FileSystemStorage
+    storage = FileSystemStorage(location=str(tmp_path))
+    monkeypatch.setattr("django_remote_json.remote_json_field.default_storage", storage)
+    monkeypatch.setattr("django_remote_json.remote_json_proxy.default_storage", storage)
+    obj = create(); obj.remote_data = {"v": 1}; obj.save()
+    path = obj.remote_data._file_path
+    obj.remote_data = {"v": 2}; obj.save()
+    assert [p.name for p in tmp_path.iterdir()] == [path]
+    assert json.loads((tmp_path / path).read_text()) == {"v": 2}
+
+
+def test_async_rewrites_of_one_path_land_in_order(storage_patched, django_capture_on_commit_callbacks):
+    import threading
+    import time
+    storage = storage_patched
+    original_save = MemoryStorage.save
+    first = threading.Event()
+
+    def slow_first_save(path, content_file):
+        if not first.is_set():
+            first.set()
+            time.sleep(0.2)
+        return original_save(storage, path, content_file)
+
+    storage.save = slow_first_save
+    with django_capture_on_commit_callbacks(execute=True):
+        obj = AsyncSampleModel.objects.create()
+        obj.remote_data = {"v": 1}
+        obj.save()
+        obj.remote_data["v"] = 2
+        obj.save()
+    assert json.loads(storage.files[obj.remote_data._file_path]) == {"v": 2}
+    assert not obj.remote_data.needs_save
+
+
+def test_async_revert_to_stored_content_while_upload_pending(storage_patched, django_capture_on_commit_callbacks):
+    import time
+    storage = storage_patched
+    obj = AsyncSampleModel.objects.create()
+    with django_capture_on_commit_callbacks(execute=True):
+        obj.remote_data = {"v": 1}
+        obj.save()
+    obj.refresh_from_db()
+    original_save = MemoryStorage.save
+
+    def slow_save(path, content_file):
+        time.sleep(0.1)
+        return original_save(storage, path, content_file)
+
+    storage.save = slow_save
+    with django_capture_on_commit_callbacks(execute=True):
+        obj.remote_data["v"] = 2
+        obj.save()
+        obj.remote_data["v"] = 1
+        obj.save()
+    assert json.loads(storage.files[obj.remote_data._file_path]) == {"v": 1}
+    assert not obj.remote_data.needs_save
+
+
+def test_async_save_then_none_in_one_transaction_deletes_file(storage_patched, django_capture_on_commit_callbacks):
+    import time
+    storage = storage_patched
+    obj = AsyncSampleModel.objects.create()
+    with django_capture_on_commit_callbacks(execute=True):
+        obj.remote_data = {"v": 1}
+        obj.save()
+    original_save = MemoryStorage.save
+
+    def slow_save(path, content_file):
+        time.sleep(0.1)
+        return original_save(storage, path, content_file)
+
+    storage.save = slow_save
+    with django_capture_on_commit_callbacks(execute=True):
+        obj.remote_data["v"] = 2
+        obj.save()
+        obj.remote_data = None
+        obj.save()
+    obj.refresh_from_db()
+    assert obj.remote_data is None
+    assert storage.files == {}
+
+
+def test_async_write_failure_keeps_proxy_dirty(storage_patched, django_capture_on_commit_callbacks):
+    storage = storage_patched
+
+    def failing_save(path, content_file):
+        raise OSError("storage down")
+
+    storage.save = failing_save
+    with pytest.raises(OSError):
+        with django_capture_on_commit_callbacks(execute=True):
+            obj = AsyncSampleModel.objects.create()
+            obj.remote_data = {"a": 1}
+            obj.save()
+    assert obj.remote_data.needs_save
+    del storage.save
+    with django_capture_on_commit_callbacks(execute=True):
+        obj.save()
+    assert json.loads(storage.files[obj.remote_data._file_path]) == {"a": 1}
+
+
+def test_sync_write_failure_keeps_proxy_dirty(storage_patched):
+    storage = storage_patched
+    obj = create(); obj.remote_data = {"a": 1}; obj.save(); obj.refresh_from_db()
+    obj.remote_data["a"] = 2
+    from django.db import transaction
+    with mock.patch.object(storage, 'save', side_effect=OSError("storage down")):
+        with pytest.raises(OSError), transaction.atomic():
+            obj.save()
+    assert obj.remote_data.needs_save
+    obj.save()
+    assert json.loads(storage.files[obj.remote_data._file_path]) == {"a": 2}
+
+
+def test_mark_saved_with_stale_revision_keeps_later_mutations_dirty():
+    p = RemoteJSONProxy({"a": 1})
+    revision = p._revision
+    p["b"] = 2
+    p.mark_saved(revision)
+    assert p.needs_save
+    p.mark_saved()
+    assert not p.needs_save